@@ -1,14 +1,23 @@
 import os
+import csv
+import hashlib
+import tempfile
 import datetime
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import rapidjson                # NOTE: install 'python-rapidjson' NOT 'rapidjson'
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from attrs import define, field
 import pandas as pd
 import numpy as np
 import PySAM.Singleowner as Singleowner
 
+from hopp import __version__
 from hopp.simulation.technologies.csp.pySSC_daotk.ssc_wrap import PysamWrap, PysscWrap, ssc_wrap
 from hopp.simulation.base import BaseClass
 from hopp.simulation.technologies.dispatch.power_sources.csp_dispatch import CspDispatch
@@ -19,6 +28,35 @@ from hopp.utilities.validators import contains, gt_zero
 from hopp.utilities.log import hybrid_logger as logger
 
 
+# Directory for cached parsed weather data, caching is disabled unless set, e.g., through the HOPP_WEATHER_CACHE_DIR
+# environment variable
+WEATHER_CACHE_DIR = Path(os.environ["HOPP_WEATHER_CACHE_DIR"]) if "HOPP_WEATHER_CACHE_DIR" in os.environ else None
+
+# bump when the parsed weather data changes, so stale caches of weather files are re-parsed
+WEATHER_CACHE_FORMAT = 2
+
+
+def load_params_file(path: str) -> dict:
+    """
+    Loads SSC parameters from a JSON file. Uses orjson when installed and falls back to rapidjson, e.g., for files
+    containing NaN values, which orjson rejects.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Dictionary of parameters
+    """
+    with open(path, 'rb') as f:
+        contents = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(contents)
+        except orjson.JSONDecodeError:
+            pass
+    return rapidjson.loads(contents)
+
+
 class CspOutputs:
     """Object for storing CSP outputs from SSC (SAM's Simulation Core) and dispatch optimization."""
     def __init__(self):
@@ -141,6 +179,7 @@ class CspPlant(PowerSource):
         self.initialize_params()
 
         self.year_weather_df = self.tmy3_to_df()  # read entire weather file
+        self.year_weather_arrays = self.weather_df_to_arrays(self.year_weather_df)
 
         # set from config
         self.cycle_capacity_kw = self.config.cycle_capacity_kw
@@ -193,40 +232,85 @@ class CspPlant(PowerSource):
         .. note::
             Be careful of leading spaces in the column names, they are hard to catch and break the parser
 
+        .. note::
+            If ``WEATHER_CACHE_DIR`` is set, the parsed data is cached there in a NumPy .npz file and reused while the
+            weather file's modification time, the cache format and the HOPP version are unchanged
+
         Returns:
             Weather file data (DataFrame)
         """
-        df = pd.read_csv(self.site.solar_resource.filename, sep=',', skiprows=2, header=0)
+        filename = self.site.solar_resource.filename
+        cache_filename = None
+        if WEATHER_CACHE_DIR is not None:
+            source = os.path.abspath(filename)
+            cache_key = {
+                'format': WEATHER_CACHE_FORMAT,
+                'hopp_version': __version__,
+                'source': source,
+                'mtime': os.path.getmtime(filename)
+            }
+            source_hash = hashlib.blake2b(source.encode(), digest_size=20).hexdigest()
+            cache_filename = Path(WEATHER_CACHE_DIR) / f"weather_{source_hash}.npz"
+
+        if cache_filename is not None and cache_filename.is_file():
+            try:
+                with np.load(cache_filename, allow_pickle=False) as cached:
+                    meta = rapidjson.loads(cached['meta'].item())
+                    if all(meta.get(k) == v for k, v in cache_key.items()):
+                        df = pd.DataFrame({c: cached[f'column_{i}'] for i, c in enumerate(meta['columns'])},
+                                          index=pd.DatetimeIndex(cached['index'], name='datetime'))
+                        df.attrs.update(meta['location'])
+                        return df
+            except Exception as e:
+                logger.warning(f"Could not load cached weather data from {cache_filename}: {e}")
+
+        # read metadata header and data table with a single pass through the file
+        with open(filename, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            meta = dict(zip(next(reader), next(reader)))
+            # skip unnamed columns (which are empty) while parsing
+            df = pd.read_csv(f, sep=',', header=0,
+                             usecols=lambda c: c.strip() != '' and not c.startswith('Unnamed'))
         date_cols = ['Year', 'Month', 'Day', 'Hour', 'Minute']
+        df['Year'] = df['Year'].iloc[0]  # normalize all years to that of 1/1
         df.index = pd.to_datetime(df[date_cols])
         df.index.name = 'datetime'
         df.drop(date_cols, axis=1, inplace=True)
 
-        df.index = df.index.map(lambda t: t.replace(year=df.index[0].year))  # normalize all years to that of 1/1
-        df = df[df.columns.drop(list(df.filter(regex='Unnamed')))]  # drop unnamed columns (which are empty)
-
-        def get_weatherfile_location(tmy3_path):
-            df_meta = pd.read_csv(tmy3_path, sep=',', header=0, nrows=1)
-            return {
-                'latitude': float(df_meta['Latitude'][0]),
-                'longitude': float(df_meta['Longitude'][0]),
-                'timezone': int(df_meta['Time Zone'][0]),
-                'elevation': float(df_meta['Elevation'][0])
-            }
-
-        location = get_weatherfile_location(self.site.solar_resource.filename)
+        location = {
+            'latitude': float(meta['Latitude']),
+            'longitude': float(meta['Longitude']),
+            'timezone': int(float(meta['Time Zone'])),
+            'elevation': float(meta['Elevation'])
+        }
         df.attrs.update(location)
+
+        # only numeric data is cached, each column is stored as a plain array of its own dtype
+        if cache_filename is not None and all(dtype.kind in 'biuf' for dtype in df.dtypes):
+            meta = dict(cache_key, columns=df.columns.tolist(), location=location)
+            columns = {f'column_{i}': df[c].to_numpy() for i, c in enumerate(df.columns)}
+            tmp_filename = None
+            try:
+                os.makedirs(cache_filename.parent, exist_ok=True)
+                # write to a temporary file and move it into place, so parallel runs never see a partial file
+                with tempfile.NamedTemporaryFile(dir=cache_filename.parent, suffix='.npz', delete=False) as f:
+                    tmp_filename = f.name
+                    np.savez(f, meta=np.array(rapidjson.dumps(meta)), index=df.index.to_numpy(), **columns)
+                os.replace(tmp_filename, cache_filename)
+            except OSError as e:
+                logger.debug(f"Could not cache weather data to {cache_filename}: {e}")
+                if tmp_filename is not None and os.path.exists(tmp_filename):
+                    os.remove(tmp_filename)
         return df
 
     def set_params_from_files(self):
         """
         Loads default case parameters from files
         """
-        with open(self.param_files['tech_model_params_path'], 'r') as f:
-            ssc_params = rapidjson.load(f)
+        ssc_params = load_params_file(self.param_files['tech_model_params_path'])
         self.ssc.set(ssc_params)
 
-        wlim_series = np.array(pd.read_csv(self.param_files['wlim_series_path']))
+        wlim_series = np.loadtxt(self.param_files['wlim_series_path'], delimiter=',')
         self.ssc.set({'wlim_series': wlim_series})
 
     def set_weather(
@@ -254,7 +338,7 @@ class CspPlant(PowerSource):
         if start_datetime is None and end_datetime is None:
             if len(weather_df) != ssc_time_steps_per_hour * 8760:
                 raise Exception('Full year weather dataframe required if start and end datetime are not provided')
-            weather_df_part = weather_df
+            start_pos, end_pos = 0, len(weather_df)
         else:
             weather_year = weather_df.index[0].year
             if start_datetime.year != weather_year:
@@ -269,82 +353,115 @@ class CspPlant(PowerSource):
             if end_datetime <= start_datetime:
                 end_datetime = start_datetime + weather_timedelta
 
-            # times in weather file are the start (or middle) of time step
-            weather_df_part = weather_df[start_datetime:(end_datetime - weather_timedelta)]
-
-        def weather_df_to_ssc_table(weather_df):
-            rename_from_to = {
-                'Tdry': 'Temperature',
-                'Tdew': 'Dew Point',
-                'RH': 'Relative Humidity',
-                'Pres': 'Pressure',
-                'Wspd': 'Wind Speed',
-                'Wdir': 'Wind Direction'
-            }
-            weather_df = weather_df.rename(columns=rename_from_to)
+            # times in weather file are the start (or middle) of time step, locate the horizon in the index since
+            # weather files can skip time steps (e.g., Feb 29th in leap years)
+            start_pos = weather_df.index.searchsorted(start_datetime)
+            end_pos = weather_df.index.searchsorted(end_datetime - weather_timedelta, side='right')
 
-            solar_resource_data = {}
-            solar_resource_data['tz'] = weather_df.attrs['timezone']
-            solar_resource_data['elev'] = weather_df.attrs['elevation']
-            solar_resource_data['lat'] = weather_df.attrs['latitude']
-            solar_resource_data['lon'] = weather_df.attrs['longitude']
-            solar_resource_data['year'] = list(weather_df.index.year)
-            solar_resource_data['month'] = list(weather_df.index.month)
-            solar_resource_data['day'] = list(weather_df.index.day)
-            solar_resource_data['hour'] = list(weather_df.index.hour)
-            solar_resource_data['minute'] = list(weather_df.index.minute)
-            solar_resource_data['dn'] = list(weather_df['DNI'])
-            solar_resource_data['df'] = list(weather_df['DHI'])
-            solar_resource_data['gh'] = list(weather_df['GHI'])
-            solar_resource_data['wspd'] = list(weather_df['Wind Speed'])
-            solar_resource_data['tdry'] = list(weather_df['Temperature'])
-            solar_resource_data['pres'] = list(weather_df['Pressure'])
-            if 'Dew Point' in weather_df.columns:
-                solar_resource_data['tdew'] = list(weather_df['Dew Point'])
-            elif 'Relative Humidity' in weather_df.columns:
-                solar_resource_data['rh'] = list(weather_df['Relative Humidity'])
+        if weather_df is self.year_weather_df:
+            weather_arrays = self.year_weather_arrays
+        else:
+            weather_arrays = self.weather_df_to_arrays(weather_df)
+
+        def weather_arrays_to_ssc_table(weather_arrays, start_pos, end_pos):
+            # slice views of the simulation horizon from each time series array
+            weather_part = {k: v[start_pos:end_pos] if isinstance(v, np.ndarray) else v
+                            for k, v in weather_arrays.items()}
+
+            datetime_start = datetime.datetime(
+                year=int(weather_part['year'][0]),
+                month=int(weather_part['month'][0]),
+                day=int(weather_part['day'][0]),
+                hour=int(weather_part['hour'][0]),
+                minute=int(weather_part['minute'][0]))
+            n = len(weather_part['dn'])
+            if n < 2:
+                timestep = datetime.timedelta(hours=1)  # assume 1 so minimum of 8760 results
             else:
-                raise ValueError("CSP model requires either Dew Point or Relative Humidity "
-                                 "to be specified in weather data.")
-
-            def pad_solar_resource_data(solar_resource_data):
-                datetime_start = datetime.datetime(
-                    year=solar_resource_data['year'][0],
-                    month=solar_resource_data['month'][0],
-                    day=solar_resource_data['day'][0],
-                    hour=solar_resource_data['hour'][0],
-                    minute=solar_resource_data['minute'][0])
-                n = len(solar_resource_data['dn'])
-                if n < 2:
-                    timestep = datetime.timedelta(hours=1)  # assume 1 so minimum of 8760 results
-                else:
-                    datetime_second_time = datetime.datetime(
-                        year=solar_resource_data['year'][1],
-                        month=solar_resource_data['month'][1],
-                        day=solar_resource_data['day'][1],
-                        hour=solar_resource_data['hour'][1],
-                        minute=solar_resource_data['minute'][1])
-                    timestep = datetime_second_time - datetime_start
-                steps_per_hour = int(3600 / timestep.seconds)
-                # Substitute a non-leap year (2009) to keep multiple of 8760 assumption:
-                i0 = int((datetime_start.replace(year=2009) - datetime.datetime(2009, 1, 1, 0, 0,
-                                                                                0)).total_seconds() / timestep.seconds)
-                diff = 8760 * steps_per_hour - n
-                front_padding = [0] * i0
-                back_padding = [0] * (diff - i0)
-
-                if diff > 0:
-                    for k in solar_resource_data:
-                        if isinstance(solar_resource_data[k], list):
-                            solar_resource_data[k] = front_padding + solar_resource_data[k] + back_padding
-                    return solar_resource_data
+                datetime_second_time = datetime.datetime(
+                    year=int(weather_part['year'][1]),
+                    month=int(weather_part['month'][1]),
+                    day=int(weather_part['day'][1]),
+                    hour=int(weather_part['hour'][1]),
+                    minute=int(weather_part['minute'][1]))
+                timestep = datetime_second_time - datetime_start
+            steps_per_hour = int(3600 / timestep.seconds)
+            # Substitute a non-leap year (2009) to keep multiple of 8760 assumption:
+            i0 = int((datetime_start.replace(year=2009) - datetime.datetime(2009, 1, 1, 0, 0,
+                                                                            0)).total_seconds() / timestep.seconds)
+            n_total = 8760 * steps_per_hour
+            diff = n_total - n
+
+            # SSC requires lists, partial years are padded by copying data into a zeroed full year buffer
+            solar_resource_data = {}
+            for k, values in weather_part.items():
+                if not isinstance(values, np.ndarray):
+                    solar_resource_data[k] = values
+                elif diff > 0:
+                    padded = np.zeros(n_total, dtype=values.dtype)
+                    padded[i0:i0 + n] = values
+                    solar_resource_data[k] = padded.tolist()
                 else:
-                    return solar_resource_data
-
-            solar_resource_data = pad_solar_resource_data(solar_resource_data)
+                    solar_resource_data[k] = values.tolist()
             return solar_resource_data
 
-        self.ssc.set({'solar_resource_data': weather_df_to_ssc_table(weather_df_part)})
+        self.ssc.set({'solar_resource_data': weather_arrays_to_ssc_table(weather_arrays, start_pos, end_pos)})
+
+    @staticmethod
+    def weather_df_to_arrays(weather_df: pd.DataFrame) -> dict:
+        """
+        Converts weather data to SSC's 'solar_resource_data' fields, storing each time series as a NumPy array so
+        that simulation horizons can be sliced without going through pandas.
+
+        Args:
+            weather_df: weather information
+
+        Returns:
+            Dictionary of SSC solar resource data, location fields are scalars and time series fields are arrays
+        """
+        rename_from_to = {
+            'Tdry': 'Temperature',
+            'Tdew': 'Dew Point',
+            'RH': 'Relative Humidity',
+            'Pres': 'Pressure',
+            'Wspd': 'Wind Speed',
+            'Wdir': 'Wind Direction'
+        }
+        weather_df = weather_df.rename(columns=rename_from_to)
+
+        weather_arrays = {}
+        weather_arrays['tz'] = weather_df.attrs['timezone']
+        weather_arrays['elev'] = weather_df.attrs['elevation']
+        weather_arrays['lat'] = weather_df.attrs['latitude']
+        weather_arrays['lon'] = weather_df.attrs['longitude']
+        idx = weather_df.index
+        weather_arrays['year'] = idx.year.to_numpy()
+        weather_arrays['month'] = idx.month.to_numpy()
+        weather_arrays['day'] = idx.day.to_numpy()
+        weather_arrays['hour'] = idx.hour.to_numpy()
+        weather_arrays['minute'] = idx.minute.to_numpy()
+
+        ssc_to_df_columns = {
+            'dn': 'DNI',
+            'df': 'DHI',
+            'gh': 'GHI',
+            'wspd': 'Wind Speed',
+            'tdry': 'Temperature',
+            'pres': 'Pressure'
+        }
+        if 'Dew Point' in weather_df.columns:
+            ssc_to_df_columns['tdew'] = 'Dew Point'
+        elif 'Relative Humidity' in weather_df.columns:
+            ssc_to_df_columns['rh'] = 'Relative Humidity'
+        else:
+            raise ValueError("CSP model requires either Dew Point or Relative Humidity "
+                             "to be specified in weather data.")
+
+        # extract all columns in a single call, each column of the result is contiguous
+        values = weather_df[list(ssc_to_df_columns.values())].to_numpy()
+        for i, ssc_key in enumerate(ssc_to_df_columns):
+            weather_arrays[ssc_key] = values[:, i]
+        return weather_arrays
 
     @staticmethod
     def get_plant_state_io_map() -> dict:
@@ -675,8 +792,7 @@ class CspPlant(PowerSource):
         """
         # TODO: Create a flexible function to be used by all technologies
         cf = ssc_wrap('pyssc', 'cb_construction_financing', None)
-        with open(self.param_files['cf_params_path'], 'r') as f:
-            params = rapidjson.load(f)
+        params = load_params_file(self.param_files['cf_params_path'])
         cf.set(params)
         cf.set({'total_installed_cost': self.calculate_total_installed_cost()})
         outputs = cf.execute()
@@ -1,14 +1,53 @@
 import os
+import hashlib
+from functools import lru_cache
+from pathlib import Path
 import numpy as np
 from math import pi, log, sin
 
+import rapidjson                # NOTE: install 'python-rapidjson' NOT 'rapidjson'
 from attrs import define, field
 import PySAM.Singleowner as Singleowner
 
+from hopp import __version__
 from hopp.simulation.technologies.csp.csp_plant import CspConfig
 from hopp.simulation.technologies.csp.csp_plant import CspPlant
 from hopp.simulation.technologies.sites import SiteInfo
 from hopp.utilities.validators import contains
+from hopp.utilities.log import hybrid_logger as logger
+
+
+# Directory for cached SolarPILOT field layouts and flux/eta maps, caching is disabled unless set, e.g., through the
+# HOPP_FLUX_ETA_CACHE_DIR environment variable
+FLUX_ETA_CACHE_DIR = Path(os.environ["HOPP_FLUX_ETA_CACHE_DIR"]) if "HOPP_FLUX_ETA_CACHE_DIR" in os.environ else None
+
+# Bump when the cached field outputs or the way they are produced changes, so stale cache files are not loaded
+FLUX_ETA_CACHE_FORMAT = 1
+
+# SSC outputs needed to rebuild the field layout and flux/eta maps without re-running SolarPILOT
+FIELD_OUTPUT_KEYS = ['eta_map_out', 'flux_maps_for_import', 'A_sf', 'helio_positions', 'N_hel', 'D_rec',
+                     'rec_height', 'h_tower', 'land_area_base']
+
+
+@lru_cache(maxsize=16)
+def load_field_outputs(cache_filename: str) -> dict:
+    """
+    Loads cached field layout and flux/eta map outputs. Memoized, since the cache file names are unique to
+    the SSC inputs.
+
+    .. note::
+        Returned values are shared between calls, use :py:func:`copy_field_outputs` before modifying them
+    """
+    with open(cache_filename, 'r') as f:
+        return rapidjson.load(f, number_mode=rapidjson.NM_NAN)
+
+
+def copy_field_outputs(field_outputs: dict) -> dict:
+    """
+    Copies field outputs, which are scalars, arrays or matrices, without the overhead of ``copy.deepcopy``.
+    """
+    return {k: [list(r) if isinstance(r, list) else r for r in v] if isinstance(v, list) else v
+            for k, v in field_outputs.items()}
 
 
 # TODO: Figure out where to put this...
@@ -91,8 +130,7 @@ class TowerPlant(CspPlant):
 
         # load heliostat field  # TODO: this is required but is replaced when new field is generated
         heliostat_layout = np.genfromtxt(self.param_files['helio_positions_path'], delimiter=',')
-        N_hel = heliostat_layout.shape[0]
-        helio_positions = [heliostat_layout[j, 0:2].tolist() for j in range(N_hel)]
+        helio_positions = heliostat_layout[:, 0:2].tolist()
         self.ssc.set({'helio_positions': helio_positions})
 
     def scale_params(self, params_names: list = ['tank_heaters', 'tank_height']):
@@ -182,8 +220,8 @@ class TowerPlant(CspPlant):
         # set so unneeded dispatch targets and clearsky DNI are not required
         # TODO: probably don't need hourly sf adjustment factors
         self.ssc.set({'is_dispatch_targets': False, 'rec_clearsky_model': 1, 'time_steps_per_hour': 1,
-                      'sf_adjust:hourly': [0.0 for j in range(8760)]})
-        tech_outputs = self.ssc.execute()
+                      'sf_adjust:hourly': [0.0] * 8760})
+        tech_outputs = self.simulate_field_outputs()
         print('Finished creating field layout and simulating flux and eta maps. # Heliostats = %d, Tower height = %.1fm, Receiver height = %.2fm, Receiver diameter = %.2fm'%
              (tech_outputs['N_hel'], tech_outputs['h_tower'], tech_outputs['rec_height'], tech_outputs['D_rec']))
         self.ssc.set(original_values)
@@ -208,6 +246,50 @@ class TowerPlant(CspPlant):
 
         return field_and_flux_maps
 
+    def field_outputs_cache_key(self) -> str:
+        """
+        Hashes the current SSC inputs, which fully determine the field layout and flux/eta maps, along with the SSC
+        library version and ``FLUX_ETA_CACHE_FORMAT``.
+
+        Returns:
+            Hex digest used to name the field outputs cache file
+        """
+        params = rapidjson.dumps(self.ssc.export_params(), sort_keys=True, number_mode=rapidjson.NM_NAN,
+                                 default=lambda o: o.tolist())
+        key = f"{FLUX_ETA_CACHE_FORMAT}|{__version__}|{self.ssc.ssc.version()}|{params}"
+        return hashlib.blake2b(key.encode(), digest_size=20).hexdigest()
+
+    def simulate_field_outputs(self) -> dict:
+        """
+        Runs SSC to create the heliostat field layout and flux/eta maps. If ``FLUX_ETA_CACHE_DIR`` is set, results
+        are cached on disk keyed by a hash of the SSC inputs, so repeated runs with identical inputs load the
+        cached results instead of re-running SolarPILOT. Loaded cache files are also kept in memory for the rest of
+        the process.
+
+        Returns:
+            Dictionary of the SSC outputs in ``FIELD_OUTPUT_KEYS``
+        """
+        if FLUX_ETA_CACHE_DIR is None:
+            tech_outputs = self.ssc.execute()
+            return {k: tech_outputs[k] for k in FIELD_OUTPUT_KEYS}
+
+        cache_filename = Path(FLUX_ETA_CACHE_DIR) / f"flux_eta_{self.field_outputs_cache_key()}.json"
+        if cache_filename.is_file():
+            try:
+                return copy_field_outputs(load_field_outputs(str(cache_filename)))
+            except Exception as e:
+                logger.warning(f"Could not load cached field layout from {cache_filename}: {e}")
+
+        tech_outputs = self.ssc.execute()
+        field_outputs = {k: tech_outputs[k] for k in FIELD_OUTPUT_KEYS}
+        try:
+            os.makedirs(cache_filename.parent, exist_ok=True)
+            with open(cache_filename, 'w') as f:
+                rapidjson.dump(field_outputs, f, number_mode=rapidjson.NM_NAN)
+        except OSError as e:
+            logger.warning(f"Could not cache field layout to {cache_filename}: {e}")
+        return field_outputs
+
     def optimize_field_and_tower(self):
         """
         Optimizes heliostat field, tower height, and receiver geometry (diameter and height). This method uses
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 import numpy as np
 
 from hopp.simulation.technologies.dispatch.power_storage import (
@@ -10,6 +12,22 @@ from hopp.simulation.technologies.dispatch.power_storage import (
 )
 
 
+_BATTERY_DISPATCH_MODELS = MappingProxyType({
+    "one_cycle_heuristic": OneCycleBatteryDispatchHeuristic,
+    "heuristic": SimpleBatteryDispatchHeuristic,
+    "simple": SimpleBatteryDispatch,
+    "non_convex_LV": NonConvexLinearVoltageBatteryDispatch,
+    "convex_LV": ConvexLinearVoltageBatteryDispatch,
+    "load_following_heuristic": HeuristicLoadFollowingDispatch,
+})
+
+# Accepted types for options whose default value's type doesn't cover all valid values.
+# The first type is used to coerce values that don't match.
+_OPTION_TYPES = MappingProxyType({
+    "max_lifecycle_per_day": (float, int),
+})
+
+
 class HybridDispatchOptions:
     """
     Class for setting dispatch options through HybridSimulation class.
@@ -31,7 +49,7 @@ class HybridDispatchOptions:
 
             - **lifecycle_cost_per_kWh_cycle** (float, default=0.0265): If include_lifecycle_count, cost per kWh cycle.
 
-            - **max_lifecycle_per_day** (int, default=None): If include_lifecycle_count, how many cycles allowed per day.
+            - **max_lifecycle_per_day** (int or float, default=inf): If include_lifecycle_count, how many cycles allowed per day.
 
             - **n_look_ahead_periods** (int, default=48): Number of time periods dispatch looks ahead.
 
@@ -90,16 +108,26 @@ class HybridDispatchOptions:
         if dispatch_options is not None:
             for key, value in dispatch_options.items():
                 if hasattr(self, key):
-                    if type(getattr(self, key)) == type(value):
+                    expected_type = _OPTION_TYPES.get(key, type(getattr(self, key)))
+                    if isinstance(expected_type, type):
+                        expected_type = (expected_type,)
+                    # bool is a subclass of int, only accept it for bool options
+                    if isinstance(value, bool) and bool not in expected_type:
+                        raise ValueError(
+                            "'{}' is the wrong data type. Should be {}".format(
+                                key, expected_type[0]
+                            )
+                        )
+                    if isinstance(value, expected_type):
                         setattr(self, key, value)
                     else:
                         try:
-                            value = type(getattr(self, key))(value)
+                            value = expected_type[0](value)
                             setattr(self, key, value)
                         except:
                             raise ValueError(
                                 "'{}' is the wrong data type. Should be {}".format(
-                                    key, type(getattr(self, key))
+                                    key, expected_type[0]
                                 )
                             )
                 else:
@@ -123,18 +151,8 @@ class HybridDispatchOptions:
                 "Battery cannot be restricted to charge from PV only if grid_charging is enabled"
             )
 
-        self._battery_dispatch_model_options = {
-            "one_cycle_heuristic": OneCycleBatteryDispatchHeuristic,
-            "heuristic": SimpleBatteryDispatchHeuristic,
-            "simple": SimpleBatteryDispatch,
-            "non_convex_LV": NonConvexLinearVoltageBatteryDispatch,
-            "convex_LV": ConvexLinearVoltageBatteryDispatch,
-            "load_following_heuristic": HeuristicLoadFollowingDispatch,
-        }
-        if self.battery_dispatch in self._battery_dispatch_model_options:
-            self.battery_dispatch_class = self._battery_dispatch_model_options[
-                self.battery_dispatch
-            ]
+        if self.battery_dispatch in _BATTERY_DISPATCH_MODELS:
+            self.battery_dispatch_class = _BATTERY_DISPATCH_MODELS[self.battery_dispatch]
             if "heuristic" in self.battery_dispatch:
                 # FIXME: This should be set to the number of time steps within a day.
                 #  Dispatch time duration is not set as of now...
@@ -980,18 +980,19 @@ class CspDispatch(Dispatch):
 
         # Set available thermal energy based on forecast
         thermal_resource = self._system_model.solar_thermal_resource
-        temperature = list(self._system_model.year_weather_df.Temperature.values)
+        # slice the horizon from the plant's weather arrays, only the sliced values are converted to a list
+        temperature = self._system_model.year_weather_arrays["tdry"]
         if start_time + n_horizon > len(thermal_resource):
             field_gen = list(thermal_resource[start_time:])
             field_gen.extend(list(thermal_resource[0 : n_horizon - len(field_gen)]))
 
-            dry_bulb_temperature = list(temperature[start_time:])
+            dry_bulb_temperature = temperature[start_time:].tolist()
             dry_bulb_temperature.extend(
-                list(temperature[0 : n_horizon - len(dry_bulb_temperature)])
+                temperature[0 : n_horizon - len(dry_bulb_temperature)].tolist()
             )
         else:
             field_gen = thermal_resource[start_time : start_time + n_horizon]
-            dry_bulb_temperature = temperature[start_time : start_time + n_horizon]
+            dry_bulb_temperature = temperature[start_time : start_time + n_horizon].tolist()
 
         self.available_thermal_generation = field_gen
         # Set cycle performance parameters that depend on ambient temperature
@@ -1,6 +1,6 @@
 from typing import NamedTuple, Optional, Union
 import numpy as np
-from shapely.geometry import Point, Polygon
+from shapely.geometry import Polygon
 import PySAM.Pvwattsv8 as pv_simple
 import PySAM.Pvsamv1 as pv_detailed
 
@@ -11,7 +11,7 @@ from hopp.simulation.technologies.layout.pv_design_utils import get_modules_per_
 from hopp.simulation.technologies.layout.pv_inverter import get_inverter_attribs
 from hopp.tools.layout.plot_tools import plot_shape
 from hopp.simulation.technologies.layout.layout_tools import make_polygon_from_bounds
-from hopp.simulation.technologies.layout.pv_layout_tools import find_best_solar_size
+from hopp.simulation.technologies.layout.pv_layout_tools import find_best_solar_size, get_buffer_penalty
 
 
 class PVGridParameters(NamedTuple):
@@ -145,56 +145,39 @@ class PVLayout:
             solar_bounds[0] - np.array([solar_x_buffer_length, solar_s_buffer_length]),
             solar_bounds[1] + np.array([solar_x_buffer_length, 0]))
 
-        def get_bounds_center(shape):
-            bounds = shape.bounds
-            return Point(.5 * (bounds[0] + bounds[2]), .5 * (bounds[1] + bounds[3]))
+        def get_bounds_center(bounds):
+            return .5 * (bounds[0] + bounds[2]), .5 * (bounds[1] + bounds[3])
+
+        site_width, site_height = float(site_bounds_size[0]), float(site_bounds_size[1])
 
         def get_excess_buffer(buffer, solar_region, bounding_shape):
             excess_buffer = 0.0
             buffer_intersection = buffer.intersection(bounding_shape)
 
-            if buffer_intersection.area > 1e-3:
-                shape_center = get_bounds_center(buffer)
-                intersection_center = get_bounds_center(buffer_intersection)
-                shape_center_delta = \
-                    np.abs(np.array(shape_center.coords) - np.array(intersection_center.coords)) / site_bounds_size
-                total_shape_center_delta = np.sum(shape_center_delta ** 2)
-                excess_buffer += total_shape_center_delta
-
+            # compute each shape's bounds only once
             bounds = buffer.bounds
             intersection_bounds = buffer_intersection.bounds
+            solar_region_bounds = solar_region.bounds
 
-            if len(intersection_bounds) > 0:
-                west_excess = intersection_bounds[0] - bounds[0]
-                south_excess = intersection_bounds[1] - bounds[1]
-                east_excess = bounds[2] - intersection_bounds[2]
-                north_excess = bounds[3] - intersection_bounds[3]
-            else:
-                west_excess = south_excess = east_excess = north_excess = 0
-
-            solar_bounds = solar_region.bounds
-            actual_aspect = (solar_bounds[3] - solar_bounds[1]) / \
-                            (solar_bounds[2] - solar_bounds[0])
-
-            aspect_error = np.abs(np.log(actual_aspect) - np.log(solar_aspect))
-            excess_buffer += aspect_error ** 2
-
-            # excess buffer, minus minimum size
-            # excess buffer is how much extra there is, but we must not penalise minimum sizes
-            #
-            # excess_x_buffer = max(0.0, es - min_spacing)
-            # excess_y_buffer = max(0.0, min(ee, ew) - min_spacing)
-
-            # if buffer has excess, then we need to penalize any excess buffer length beyond the minimum
-
-            minimum_s_buffer = max(solar_s_buffer_length - south_excess, self.min_spacing)
-            excess_x_buffer = (solar_s_buffer_length - minimum_s_buffer) / self.min_spacing
-            excess_buffer += excess_x_buffer ** 2
-
-            minimum_w_buffer = max(solar_x_buffer_length - west_excess, self.min_spacing)
-            minimum_e_buffer = max(solar_x_buffer_length - east_excess, self.min_spacing)
-            excess_y_buffer = (solar_x_buffer_length - max(minimum_w_buffer, minimum_e_buffer)) / self.min_spacing
-            excess_buffer += excess_y_buffer ** 2
+            if buffer_intersection.area > 1e-3:
+                shape_center_x, shape_center_y = get_bounds_center(bounds)
+                intersection_center_x, intersection_center_y = get_bounds_center(intersection_bounds)
+                dx = (shape_center_x - intersection_center_x) / site_width
+                dy = (shape_center_y - intersection_center_y) / site_height
+                excess_buffer += dx * dx + dy * dy
+
+            if buffer_intersection.is_empty:
+                intersection_bounds = bounds
+
+            excess_buffer += get_buffer_penalty(
+                bounds,
+                intersection_bounds,
+                solar_region_bounds,
+                solar_aspect,
+                solar_x_buffer_length,
+                solar_s_buffer_length,
+                self.min_spacing
+            )
 
             return excess_buffer
 
@@ -1,6 +1,6 @@
 from typing import List
 import warnings
-from math import floor
+from math import floor, log
 from shapely.geometry import MultiLineString, GeometryCollection, MultiPoint, Point
 
 import PySAM.Pvwattsv8 as pvwatts
@@ -127,6 +127,48 @@ def find_best_solar_size(
     return best
 
 
+def get_buffer_penalty(
+        bounds: Tuple[float, float, float, float],
+        intersection_bounds: Tuple[float, float, float, float],
+        solar_bounds: Tuple[float, float, float, float],
+        solar_aspect: float,
+        x_buffer_length: float,
+        s_buffer_length: float,
+        min_spacing: float
+        ) -> float:
+    """
+    Penalizes the solar region's deviation from the target aspect ratio and any buffer length beyond the minimum
+    spacing. Inputs are plain floats so the arithmetic avoids NumPy dispatch overhead on scalars.
+    :param bounds: bounds of the buffer region, (minx, miny, maxx, maxy)
+    :param intersection_bounds: bounds of the buffer region's intersection with the site, (minx, miny, maxx, maxy)
+    :param solar_bounds: bounds of the solar region, (minx, miny, maxx, maxy)
+    :param solar_aspect: target aspect ratio (height / width) of the solar region
+    :param x_buffer_length: length of the buffer on the east and west sides of the solar region in meters
+    :param s_buffer_length: length of the buffer on the south side of the solar region in meters
+    :param min_spacing: minimum buffer length in meters, buffer up to this length is not penalized
+    :return: sum of the squared aspect ratio error and squared excess buffer lengths (normalized by min_spacing)
+    """
+    west_excess = intersection_bounds[0] - bounds[0]
+    south_excess = intersection_bounds[1] - bounds[1]
+    east_excess = bounds[2] - intersection_bounds[2]
+
+    actual_aspect = (solar_bounds[3] - solar_bounds[1]) / (solar_bounds[2] - solar_bounds[0])
+    aspect_error = abs(log(actual_aspect) - log(solar_aspect))
+    penalty = aspect_error ** 2
+
+    # excess buffer is how much extra there is, but we must not penalise minimum sizes
+    minimum_s_buffer = max(s_buffer_length - south_excess, min_spacing)
+    excess_x_buffer = (s_buffer_length - minimum_s_buffer) / min_spacing
+    penalty += excess_x_buffer ** 2
+
+    minimum_w_buffer = max(x_buffer_length - west_excess, min_spacing)
+    minimum_e_buffer = max(x_buffer_length - east_excess, min_spacing)
+    excess_y_buffer = (x_buffer_length - max(minimum_w_buffer, minimum_e_buffer)) / min_spacing
+    penalty += excess_y_buffer ** 2
+
+    return penalty
+
+
 def place_solar_strands(max_num_modules: int,
                         min_strand_length: int,
                         site_shape: BaseGeometry,
@@ -1,9 +1,11 @@
 import pytest
 import datetime
+import numpy as np
 
 
 from hopp.simulation import HoppInterface
 from hopp.simulation.technologies.dispatch.power_sources.csp_dispatch import CspDispatch
+from hopp.simulation.technologies.csp import csp_plant
 from hopp.simulation.technologies.csp.tower_plant import TowerPlant, TowerConfig
 from hopp.simulation.technologies.csp.trough_plant import TroughPlant, TroughConfig
 from tests.hopp.utils import create_default_site_info
@@ -387,4 +389,56 @@ def test_tower_annual_financial(site):
     assert csp.ssc.get('N_hel') == pytest.approx(expected_Nhel, 1e-3)
     assert csp.annual_energy_kwh == pytest.approx(expected_energy, 2e-3)
     assert csp._financial_model.value('lcoe_nom') == pytest.approx(expected_lcoe_nom, 2e-3)
-    assert csp._financial_model.value('lppa_nom') == pytest.approx(expected_ppa_nom, 2e-3)
\ No newline at end of file
+    assert csp._financial_model.value('lppa_nom') == pytest.approx(expected_ppa_nom, 2e-3)
+
+
+def test_weather_file_cache(site, tmp_path, monkeypatch):
+    """Testing parsed weather data is cached and reused"""
+    monkeypatch.setattr(csp_plant, 'WEATHER_CACHE_DIR', tmp_path)
+
+    trough_config = {'cycle_capacity_kw': 100 * 1000,
+                     'solar_multiple': 1.5,
+                     'tes_hours': 5.0}
+
+    config = TroughConfig.from_dict(trough_config)
+    csp = TroughPlant(site, config=config)
+
+    cache_files = list(tmp_path.glob("weather_*.npz"))
+    assert len(cache_files) == 1
+    with np.load(cache_files[0], allow_pickle=False) as cached:
+        assert 'index' in cached
+
+    cached_df = csp.tmy3_to_df()
+    assert cached_df.equals(csp.year_weather_df)
+    assert cached_df.dtypes.equals(csp.year_weather_df.dtypes)
+    assert cached_df.attrs == csp.year_weather_df.attrs
+
+
+def test_set_weather_partial_year(site):
+    """Testing pySSC weather data is set for a partial year simulation horizon"""
+    trough_config = {'cycle_capacity_kw': 100 * 1000,
+                     'solar_multiple': 1.5,
+                     'tes_hours': 5.0}
+
+    config = TroughConfig.from_dict(trough_config)
+    csp = TroughPlant(site, config=config)
+
+    weather_df = csp.year_weather_df
+    start_datetime, end_datetime = CspDispatch.get_start_end_datetime(293*24, 72)
+    csp.set_weather(weather_df, start_datetime, end_datetime)
+    solar_resource_data = csp.ssc.get('solar_resource_data')
+
+    start_datetime = start_datetime.replace(year=weather_df.index[0].year)
+    end_datetime = end_datetime.replace(year=weather_df.index[0].year)
+    expected_df = weather_df[start_datetime:(end_datetime - datetime.timedelta(hours=1))]
+    i0 = weather_df.index.get_loc(expected_df.index[0])
+    n = len(expected_df)
+
+    # weather file times are at the half hour, so the window holds 71 rows. The file is normalized to 2012 but
+    # skips Feb 29th, so Oct 21st 00:30 is row 293 * 24, where SSC places it using a non-leap year
+    assert n == 71
+    assert i0 == 293 * 24
+    assert len(solar_resource_data['dn']) == 8760
+    assert solar_resource_data['dn'][i0:i0 + n] == expected_df['DNI'].tolist()
+    assert sum(solar_resource_data['dn'][:i0]) == 0
+    assert sum(solar_resource_data['dn'][i0 + n:]) == 0
@@ -1048,4 +1048,28 @@ def test_dispatch_load_following_heuristic_with_wave(site, subtests):
     with subtests.test("charge power"):
         assert sum(discharge) > 0.0
     with subtests.test("discharge power"):
-        assert sum(charge) < 0.0
\ No newline at end of file
+        assert sum(charge) < 0.0
+
+
+def test_hybrid_dispatch_options_types():
+    options = HybridDispatchOptions({'n_clusters': 20,
+                                     'max_lifecycle_per_day': 1,
+                                     'time_weighting_factor': 1,
+                                     'n_look_ahead_periods': 24.0,
+                                     'grid_charging': 0})
+    assert options.n_clusters == 20 and type(options.n_clusters) is int
+    assert options.max_lifecycle_per_day == 1 and type(options.max_lifecycle_per_day) is int
+    assert type(options.time_weighting_factor) is float
+    assert options.n_look_ahead_periods == 24 and type(options.n_look_ahead_periods) is int
+    assert options.grid_charging is False
+
+    options = HybridDispatchOptions({'max_lifecycle_per_day': 0.5})
+    assert options.max_lifecycle_per_day == 0.5
+
+    with pytest.raises(ValueError):
+        HybridDispatchOptions({'n_clusters': True})
+    with pytest.raises(ValueError):
+        HybridDispatchOptions({'n_clusters': 'many'})
+
+    with pytest.raises(NameError):
+        HybridDispatchOptions({'_battery_dispatch_model_options': {'simple': SimpleBatteryDispatch}})
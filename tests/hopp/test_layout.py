@@ -14,6 +14,7 @@ from hopp.simulation.technologies.pv.pv_plant import PVPlant, PVConfig
 from hopp.simulation.technologies.layout.hybrid_layout import HybridLayout, WindBoundaryGridParameters, PVGridParameters, get_flicker_loss_multiplier
 from hopp.simulation.technologies.layout.wind_layout_tools import create_grid
 from hopp.simulation.technologies.layout.pv_design_utils import size_electrical_parameters, find_modules_per_string
+from hopp.simulation.technologies.layout.pv_layout_tools import get_buffer_penalty
 from hopp.simulation.technologies.pv.detailed_pv_plant import DetailedPVPlant, DetailedPVConfig
 
 from hopp.utilities.utils_for_tests import create_default_site_info
@@ -101,6 +102,23 @@ def test_solar_layout(site):
         assert buffer_region[i] == pytest.approx(expected_buffer_region[i], 1e-3)
 
 
+def test_solar_buffer_penalty():
+    solar_bounds = (100., 100., 200., 200.)
+    bounds = (0., 0., 300., 200.)
+
+    # minimum buffers fully inside the site and solar region at the target aspect
+    assert get_buffer_penalty(bounds, bounds, solar_bounds, 1., 100., 100., 100.) == approx(0.)
+
+    # solar region aspect off by a factor of e
+    penalty = get_buffer_penalty(bounds, bounds, solar_bounds, np.exp(1.), 150., 150., 100.)
+    assert penalty == approx(1.)
+
+    # buffer lengths extending outside of the site beyond the minimum spacing are penalized
+    intersection_bounds = (50., 50., 250., 200.)
+    penalty = get_buffer_penalty(bounds, intersection_bounds, solar_bounds, 1., 150., 150., 100.)
+    assert penalty == approx(0.5 ** 2 + 0.5 ** 2)
+
+
 def test_hybrid_layout(site):
     pv_config = PVConfig.from_dict(technology['pv'])
     wind_config = WindConfig.from_dict(technology['wind'])
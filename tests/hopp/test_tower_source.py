@@ -3,7 +3,8 @@ from pytest import fixture
 
 from numpy.testing import assert_array_equal
 
-from hopp.simulation.technologies.csp.tower_plant import TowerConfig, TowerPlant
+from hopp.simulation.technologies.csp import tower_plant
+from hopp.simulation.technologies.csp.tower_plant import TowerConfig, TowerPlant, load_field_outputs
 from tests.hopp.utils import create_default_site_info
 
 
@@ -59,4 +60,29 @@ def test_trough_init(site, subtests):
         data = config_data.copy()
         data["scale_input_params"] = True
 
-        TowerPlant(site, config=config)
\ No newline at end of file
+        TowerPlant(site, config=config)
+
+
+def test_field_outputs_cache(site, tmp_path, monkeypatch):
+    monkeypatch.setattr(tower_plant, 'FLUX_ETA_CACHE_DIR', tmp_path)
+    load_field_outputs.cache_clear()
+
+    tower = TowerPlant(site, config=TowerConfig.from_dict(config_data))
+    field = tower.create_field_layout_and_simulate_flux_eta_maps()
+
+    # first call misses the cache, runs SolarPILOT and writes the cache file
+    assert load_field_outputs.cache_info().misses == 0
+    assert len(list(tmp_path.glob("flux_eta_*.json"))) == 1
+
+    tower_cached = TowerPlant(site, config=TowerConfig.from_dict(config_data))
+    field_cached = tower_cached.create_field_layout_and_simulate_flux_eta_maps()
+    assert load_field_outputs.cache_info().misses == 1
+    for k in ['N_hel', 'D_rec', 'rec_height', 'h_tower', 'land_area_base', 'A_sf_in']:
+        assert field_cached[k] == field[k]
+    assert field_cached['helio_positions'] == field['helio_positions']
+
+    # cached outputs are kept in memory, and copies are handed out so plants can't modify each other's fields
+    field_memoized = TowerPlant(site, config=TowerConfig.from_dict(config_data)).create_field_layout_and_simulate_flux_eta_maps()
+    assert load_field_outputs.cache_info().hits == 1
+    assert field_memoized['helio_positions'] == field_cached['helio_positions']
+    assert field_memoized['helio_positions'] is not field_cached['helio_positions']